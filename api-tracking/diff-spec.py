@@ -4,6 +4,9 @@
 Usage:
     python3 diff-spec.py <baseline.json> <current.json>
 
+Set DIFF_SPEC_CACHE=1 when iterating locally to keep extracted specs in
+`<spec>.v<N>.cache.json` sidecars and skip re-extracting unchanged files.
+
 Classifies every change as Breaking, Additive, or Cosmetic and groups the
 Markdown report so the highest-impact items appear first. Exits 1 when any
 change is detected so the api-tracking workflow can file a GitHub issue.
@@ -20,15 +23,57 @@ What "Cosmetic" means: tag, summary, or description churn. Filtered out of
 the main report (collapsed at the bottom) to keep noise out of the issue.
 """
 
-import json
+import hashlib
+import os
 import sys
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-
-HTTP_METHODS = {"get", "post", "put", "patch", "delete"}
-
-
-def _combinator_signature(p):
+from typing import Any
+
+try:
+    # orjson decodes multi-MB specs in C; fall back to the stdlib when the
+    # runner doesn't have it installed. Both expose loads(bytes) -> dict;
+    # _dumps normalizes encoding to bytes.
+    import orjson as _json
+
+    _dumps = _json.dumps
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
+
+    def _dumps(obj):  # type: ignore[misc]
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
+# Without orjson, ijson can stream one path/schema at a time instead of
+# materializing the whole spec. Even its C backends take about twice as long
+# as a stdlib decode, and the pure-Python ones ten times longer, so streaming
+# is limited to C backends and specs big enough for memory to matter.
+# orjson's full decode is faster than any of them and is always preferred.
+# Streaming needs ijson >= 3.1 for parse(use_float=True).
+ijson: Any = None
+if _json.__name__ == "json":
+    try:
+        import ijson  # type: ignore[no-redef]
+    except ImportError:
+        pass
+    else:
+        version = tuple(int(part) for part in ijson.__version__.split(".")[:2])
+        if version < (3, 1) or ijson.backend not in ("yajl2_c", "yajl2_cffi"):
+            ijson = None
+
+_STREAMED_SECTIONS = ("paths", "components.schemas")
+_STREAM_MIN_BYTES = 32 << 20
+
+# Spec method name -> report method name. Doubles as the filter for which
+# path-item keys are operations.
+HTTP_METHODS = {"get": "GET", "post": "POST", "put": "PUT", "patch": "PATCH", "delete": "DELETE"}
+
+# Bump whenever the extracted record shapes change so stale sidecars are
+# ignored rather than loaded into the new code.
+CACHE_VERSION = 4
+
+
+def _combinator_signature(p: dict[str, Any]) -> str | None:
     """Return a oneOf/anyOf/allOf composition signature, or None if not composed."""
     for combinator in ("oneOf", "anyOf", "allOf"):
         if combinator in p:
@@ -37,7 +82,7 @@ def _combinator_signature(p):
     return None
 
 
-def _scalar_signature(p):
+def _scalar_signature(p: dict[str, Any]) -> str:
     """Return the type/format/nullable signature for a scalar schema."""
     t = p.get("type")
     fmt = p.get("format")
@@ -45,7 +90,7 @@ def _scalar_signature(p):
     return f"{t or '?'}{f'({fmt})' if fmt else ''}{nullable}"
 
 
-def prop_signature(p):
+def prop_signature(p: Any) -> str:
     """Return a stable comparable string describing a property/parameter type.
 
     Captures: type, format, $ref target, array element type, oneOf/anyOf/allOf
@@ -68,23 +113,23 @@ def prop_signature(p):
     return _scalar_signature(p)
 
 
-def prop_enum(p):
+def prop_enum(p: Any) -> frozenset | None:
     """Return a frozenset of enum values, or None if not enumerated."""
     if isinstance(p, dict) and isinstance(p.get("enum"), list):
         return frozenset(p["enum"])
     return None
 
 
-def request_body_ref(details):
+def request_body_ref(details: dict[str, Any]) -> str | None:
     """Return the JSON request body schema $ref, if any."""
     rb = details.get("requestBody") or {}
     schema = rb.get("content", {}).get("application/json", {}).get("schema", {})
     return prop_signature(schema) if schema else None
 
 
-def response_refs(details):
+def response_refs(details: dict[str, Any]) -> dict[str, str]:
     """Return dict of status_code -> JSON response schema signature."""
-    out = {}
+    out: dict[str, str] = {}
     for code, resp in (details.get("responses") or {}).items():
         if not code.startswith("2"):
             continue
@@ -94,63 +139,120 @@ def response_refs(details):
     return out
 
 
-def extract_parameters(details):
-    """Extract inlined parameter metadata for one endpoint operation."""
-    params = []
+@dataclass(frozen=True, slots=True)
+class Param:
+    """Diffable metadata for one inlined operation parameter."""
+
+    name: str
+    location: str
+    required: bool
+    type: str
+    enum: frozenset | None
+
+
+@dataclass(frozen=True, slots=True)
+class Endpoint:
+    """Diffable metadata for one operation, keyed as "METHOD /path"."""
+
+    operation_id: str
+    summary: str
+    tags: list[str]
+    deprecated: bool
+    parameters: dict[str, Param]
+    request_body: str | None
+    responses: dict[str, str]
+    category: str
+
+
+@dataclass(frozen=True, slots=True)
+class Property:
+    """Diffable type/enum signature of one schema property."""
+
+    type: str
+    enum: frozenset | None
+
+
+Endpoints = dict[str, Endpoint]
+Schemas = dict[str, dict[str, Any]]
+
+# Schemas repeat the same few property shapes (ids, timestamps, links), so
+# equal Property records are collapsed to one shared instance.
+_PROPERTY_POOL: dict[Property, Property] = {}
+
+
+def _intern_property(p: Property) -> Property:
+    """Return the pooled instance equal to p, adding p if it is new."""
+    return _PROPERTY_POOL.setdefault(p, p)
+
+
+def extract_parameters(details: dict[str, Any]) -> dict[str, Param]:
+    """Extract inlined parameter metadata for one operation, keyed by name."""
+    params: dict[str, Param] = {}
     for p in details.get("parameters", []):
         # Skip $ref-only parameters that aren't inlined; they have no name.
-        if not p.get("name"):
+        name = p.get("name")
+        if not name:
             continue
         schema = p.get("schema", {})
-        params.append(
-            {
-                "name": p.get("name"),
-                "in": p.get("in"),
-                "required": p.get("required", False),
-                "type": prop_signature(schema),
-                "enum": prop_enum(schema),
-            }
+        params[name] = Param(
+            name=name,
+            location=p.get("in"),
+            required=p.get("required", False),
+            type=prop_signature(schema),
+            enum=prop_enum(schema),
         )
     return params
 
 
-def extract_endpoints(spec):
-    """Extract per-endpoint metadata sufficient for behavioral diffing."""
-    endpoints = {}
-    for path, methods in spec.get("paths", {}).items():
-        for method, details in methods.items():
-            if method not in HTTP_METHODS:
-                continue
-            endpoints[(method.upper(), path)] = {
-                "operationId": details.get("operationId", ""),
-                "summary": details.get("summary", ""),
-                "tags": details.get("tags", []),
-                "deprecated": details.get("deprecated", False),
-                "parameters": extract_parameters(details),
-                "request_body": request_body_ref(details),
-                "responses": response_refs(details),
-            }
+def _add_path_endpoints(endpoints: Endpoints, path: str, methods: dict[str, Any]) -> None:
+    """Add the operations of one path item to endpoints."""
+    for method, details in methods.items():
+        verb = HTTP_METHODS.get(method)
+        if verb is None:
+            continue
+        endpoints[f"{verb} {path}"] = Endpoint(
+            operation_id=details.get("operationId", ""),
+            summary=details.get("summary", ""),
+            tags=details.get("tags", []),
+            deprecated=details.get("deprecated", False),
+            parameters=extract_parameters(details),
+            request_body=request_body_ref(details),
+            responses=response_refs(details),
+            category=categorize_endpoint(path),
+        )
+
+
+def _add_schema(schemas: Schemas, name: str, schema: dict[str, Any]) -> None:
+    """Add one component schema's property, enum, and required info to schemas."""
+    props = {
+        pname: _intern_property(Property(prop_signature(pschema), prop_enum(pschema)))
+        for pname, pschema in schema.get("properties", {}).items()
+    }
+    schemas[name] = {
+        "properties": props,
+        "required": frozenset(schema.get("required", [])),
+        "top_enum": prop_enum(schema),
+    }
+
+
+def extract_endpoints(path_items: Iterable[tuple[str, dict[str, Any]]]) -> Endpoints:
+    """Extract per-endpoint metadata from (path, methods) pairs of a spec."""
+    endpoints: Endpoints = {}
+    for path, methods in path_items:
+        _add_path_endpoints(endpoints, path, methods)
     return endpoints
 
 
-def extract_schemas(spec):
+def extract_schemas(schema_items: Iterable[tuple[str, dict[str, Any]]]) -> Schemas:
     """Extract per-schema property type, enum, and required info."""
-    out = {}
-    for name, schema in spec.get("components", {}).get("schemas", {}).items():
-        props = {
-            pname: {"type": prop_signature(pschema), "enum": prop_enum(pschema)}
-            for pname, pschema in schema.get("properties", {}).items()
-        }
-        out[name] = {
-            "properties": props,
-            "required": frozenset(schema.get("required", [])),
-            "top_enum": prop_enum(schema),
-        }
+    out: Schemas = {}
+    for name, schema in schema_items:
+        _add_schema(out, name, schema)
     return out
 
 
-def categorize_endpoint(method, path):
-    """Categorize an endpoint as standard, experimental, or enterprise."""
+def categorize_endpoint(path: str) -> str:
+    """Categorize an endpoint path as standard, experimental, or enterprise."""
     if "/v2-experimental/" in path:
         return "experimental"
     if "/orgs/" in path or "enterprise" in path.lower():
@@ -182,47 +284,44 @@ class Buckets:
 
 def _diff_endpoint_metadata(old, new, b):
     """Diff deprecated/request-body/response/summary/tags into the buckets."""
-    if old.get("deprecated") != new.get("deprecated"):
-        msg = f"deprecated: {old.get('deprecated')} -> {new.get('deprecated')}"
-        (b.additive if new.get("deprecated") else b.breaking).append(msg)
+    if old.deprecated != new.deprecated:
+        msg = f"deprecated: {old.deprecated} -> {new.deprecated}"
+        (b.additive if new.deprecated else b.breaking).append(msg)
 
-    if old.get("request_body") != new.get("request_body"):
-        b.breaking.append(
-            f"request body schema: {old.get('request_body')} -> {new.get('request_body')}"
-        )
+    if old.request_body != new.request_body:
+        b.breaking.append(f"request body schema: {old.request_body} -> {new.request_body}")
 
-    old_resp = old.get("responses", {})
-    new_resp = new.get("responses", {})
-    for code in sorted(set(old_resp) | set(new_resp)):
+    old_resp = old.responses
+    new_resp = new.responses
+    for code in sorted(old_resp.keys() | new_resp.keys()):
         ov, nv = old_resp.get(code), new_resp.get(code)
         if ov != nv:
             b.breaking.append(f"response {code} schema: {ov} -> {nv}")
 
-    if old.get("summary") != new.get("summary"):
-        b.cosmetic.append(f"summary: {old.get('summary')!r} -> {new.get('summary')!r}")
-    if old.get("tags") != new.get("tags"):
-        b.cosmetic.append(f"tags: {old.get('tags')} -> {new.get('tags')}")
+    if old.summary != new.summary:
+        b.cosmetic.append(f"summary: {old.summary!r} -> {new.summary!r}")
+    if old.tags != new.tags:
+        b.cosmetic.append(f"tags: {old.tags} -> {new.tags}")
 
 
 def _diff_one_param(name, op, np, b):
     """Diff a single parameter (old op, new np) into the buckets."""
     if op is None:
-        (b.breaking if np.get("required") else b.additive).append(
-            f"new param `{name}` ({np.get('in')}, {np.get('type')}, "
-            f"required={np.get('required')})"
+        (b.breaking if np.required else b.additive).append(
+            f"new param `{name}` ({np.location}, {np.type}, required={np.required})"
         )
         return
     if np is None:
         b.breaking.append(f"removed param `{name}`")
         return
 
-    if op.get("type") != np.get("type"):
-        b.breaking.append(f"param `{name}` type: {op.get('type')} -> {np.get('type')}")
-    if op.get("required") != np.get("required"):
-        msg = f"param `{name}` required: {op.get('required')} -> {np.get('required')}"
-        (b.breaking if np.get("required") else b.additive).append(msg)
-    if op.get("enum") != np.get("enum"):
-        added_e, removed_e = enum_delta(op.get("enum"), np.get("enum"))
+    if op.type != np.type:
+        b.breaking.append(f"param `{name}` type: {op.type} -> {np.type}")
+    if op.required != np.required:
+        msg = f"param `{name}` required: {op.required} -> {np.required}"
+        (b.breaking if np.required else b.additive).append(msg)
+    if op.enum != np.enum:
+        added_e, removed_e = enum_delta(op.enum, np.enum)
         if removed_e:
             b.breaking.append(f"param `{name}` removed enum values: {removed_e}")
         if added_e:
@@ -230,14 +329,14 @@ def _diff_one_param(name, op, np, b):
 
 
 def diff_endpoint_pair(old, new):
-    """Compare one endpoint's old/new dict; return (breaking, additive, cosmetic)."""
+    """Compare one endpoint's old/new record; return (breaking, additive, cosmetic)."""
     b = Buckets()
 
     _diff_endpoint_metadata(old, new, b)
 
-    old_p = {p["name"]: p for p in old.get("parameters", [])}
-    new_p = {p["name"]: p for p in new.get("parameters", [])}
-    for name in sorted(set(old_p) | set(new_p)):
+    old_p = old.parameters
+    new_p = new.parameters
+    for name in sorted(old_p.keys() | new_p.keys()):
         _diff_one_param(name, old_p.get(name), new_p.get(name), b)
 
     return b.as_tuple()
@@ -246,16 +345,16 @@ def diff_endpoint_pair(old, new):
 def _diff_one_property(prop, op, np, b):
     """Diff a single schema property (old op, new np) into the buckets."""
     if op is None:
-        b.additive.append(f"new property `{prop}`: {np.get('type')}")
+        b.additive.append(f"new property `{prop}`: {np.type}")
         return
     if np is None:
-        b.breaking.append(f"removed property `{prop}`: was {op.get('type')}")
+        b.breaking.append(f"removed property `{prop}`: was {op.type}")
         return
 
-    if op.get("type") != np.get("type"):
-        b.breaking.append(f"property `{prop}` type: {op.get('type')} -> {np.get('type')}")
-    if op.get("enum") != np.get("enum"):
-        added_e, removed_e = enum_delta(op.get("enum"), np.get("enum"))
+    if op.type != np.type:
+        b.breaking.append(f"property `{prop}` type: {op.type} -> {np.type}")
+    if op.enum != np.enum:
+        added_e, removed_e = enum_delta(op.enum, np.enum)
         if removed_e:
             b.breaking.append(f"property `{prop}` removed enum values: {removed_e}")
         if added_e:
@@ -293,7 +392,13 @@ def diff_schema_pair(old, new):
 
     old_props = old.get("properties", {})
     new_props = new.get("properties", {})
-    for prop in sorted(set(old_props) | set(new_props)):
+    # Only properties that differ produce messages, so only those get sorted.
+    changed = {
+        prop
+        for prop in old_props.keys() | new_props.keys()
+        if old_props.get(prop) != new_props.get(prop)
+    }
+    for prop in sorted(changed):
         _diff_one_property(prop, old_props.get(prop), new_props.get(prop), b)
 
     _diff_required(old, new, b)
@@ -302,34 +407,33 @@ def diff_schema_pair(old, new):
     return b.as_tuple()
 
 
-def format_endpoint_table(rows, source_endpoints):
-    """Render a Markdown table grouped by category for new/removed endpoints."""
-    out = []
+def format_endpoint_table(out, rows, source_endpoints):
+    """Write a Markdown table grouped by category for new/removed endpoints."""
+    w = out.write
     by_category = defaultdict(list)
-    for method, path in rows:
-        info = source_endpoints[(method, path)]
-        by_category[categorize_endpoint(method, path)].append((method, path, info))
+    for key in sorted(rows):
+        method, _, path = key.partition(" ")
+        info = source_endpoints[key]
+        by_category[info.category].append((method, path, info))
     for cat in ("standard", "experimental", "enterprise"):
         if cat not in by_category:
             continue
-        out.append(f"### {cat.title()}\n")
-        out.append("| Method | Path | Summary |")
-        out.append("|--------|------|---------|")
-        for method, path, info in by_category[cat]:
-            out.append(f"| {method} | `{path}` | {info['summary']} |")
-        out.append("")
-    return out
+        w(f"### {cat.title()}\n\n")
+        w("| Method | Path | Summary |\n")
+        w("|--------|------|---------|\n")
+        w("".join(f"| {m} | `{p}` | {info.summary} |\n" for m, p, info in by_category[cat]))
+        w("\n")
 
 
 @dataclass
 class DiffResult:
     """All computed diffs between two specs, ready for report formatting."""
 
-    ep_added: list = field(default_factory=list)
-    ep_removed: list = field(default_factory=list)
+    ep_added: set = field(default_factory=set)
+    ep_removed: set = field(default_factory=set)
     ep_changes: dict = field(default_factory=dict)
-    sc_added: list = field(default_factory=list)
-    sc_removed: list = field(default_factory=list)
+    sc_added: set = field(default_factory=set)
+    sc_removed: set = field(default_factory=set)
     sc_changes: dict = field(default_factory=dict)
     current_endpoints: dict = field(default_factory=dict)
     baseline_endpoints: dict = field(default_factory=dict)
@@ -350,76 +454,75 @@ class DiffResult:
         return [(n, a) for n, (_, a, _) in self.sc_changes.items() if a]
 
 
-def _render_diff_blocks(lines, header, entries, label_fn):
+def _render_diff_blocks(out, header, entries, label_fn):
     """Render a '### header' followed by per-entry '#### label / - diff' blocks."""
     if not entries:
         return
-    lines.append(f"### {header} ({len(entries)})\n")
+    w = out.write
+    w(f"### {header} ({len(entries)})\n\n")
     for key, diffs in entries:
-        lines.append(f"#### `{label_fn(key)}`\n")
-        for d in diffs:
-            lines.append(f"- {d}")
-        lines.append("")
+        w(f"#### `{label_fn(key)}`\n\n")
+        w("".join(f"- {d}\n" for d in diffs))
+        w("\n")
 
 
-def _render_named_list(lines, header, names):
+def _render_named_list(out, header, names):
     """Render a '### header' followed by a flat bullet list of names."""
     if not names:
         return
-    lines.append(f"### {header} ({len(names)})\n")
-    for name in names:
-        lines.append(f"- `{name}`")
-    lines.append("")
-
-
-def _ep_label(key):
-    method, path = key
-    return f"{method} {path}"
+    w = out.write
+    w(f"### {header} ({len(names)})\n\n")
+    w("".join(f"- `{name}`\n" for name in sorted(names)))
+    w("\n")
 
 
-def _render_breaking_section(lines, diff):
+def _render_breaking_section(out, diff):
     """Render the breaking-changes section."""
-    lines.append("## :rotating_light: Breaking changes\n")
-    lines.append(
-        "_Investigate these before the next release; they may affect existing tools._\n"
-    )
+    w = out.write
+    w("## :rotating_light: Breaking changes\n\n")
+    w("_Investigate these before the next release; they may affect existing tools._\n\n")
     if diff.ep_removed:
-        lines.append(f"### Removed endpoints ({len(diff.ep_removed)})\n")
-        lines.extend(format_endpoint_table(diff.ep_removed, diff.baseline_endpoints))
-    _render_named_list(lines, "Removed schemas", diff.sc_removed)
-    _render_diff_blocks(lines, "Endpoints with breaking changes", diff.breaking_eps(), _ep_label)
-    _render_diff_blocks(lines, "Schemas with breaking changes", diff.breaking_sc(), str)
+        w(f"### Removed endpoints ({len(diff.ep_removed)})\n\n")
+        format_endpoint_table(out, diff.ep_removed, diff.baseline_endpoints)
+    _render_named_list(out, "Removed schemas", diff.sc_removed)
+    _render_diff_blocks(out, "Endpoints with breaking changes", diff.breaking_eps(), str)
+    _render_diff_blocks(out, "Schemas with breaking changes", diff.breaking_sc(), str)
 
 
-def _render_additive_section(lines, diff):
+def _render_additive_section(out, diff):
     """Render the additive-changes section."""
-    lines.append("## :sparkles: Additive changes\n")
-    lines.append("_New surface; safe for existing callers but may unlock new tools._\n")
+    w = out.write
+    w("## :sparkles: Additive changes\n\n")
+    w("_New surface; safe for existing callers but may unlock new tools._\n\n")
     if diff.ep_added:
-        lines.append(f"### New endpoints ({len(diff.ep_added)})\n")
-        lines.extend(format_endpoint_table(diff.ep_added, diff.current_endpoints))
-    _render_named_list(lines, "New schemas", diff.sc_added)
-    _render_diff_blocks(lines, "Endpoints with additive changes", diff.additive_eps(), _ep_label)
-    _render_diff_blocks(lines, "Schemas with additive changes", diff.additive_sc(), str)
+        w(f"### New endpoints ({len(diff.ep_added)})\n\n")
+        format_endpoint_table(out, diff.ep_added, diff.current_endpoints)
+    _render_named_list(out, "New schemas", diff.sc_added)
+    _render_diff_blocks(out, "Endpoints with additive changes", diff.additive_eps(), str)
+    _render_diff_blocks(out, "Schemas with additive changes", diff.additive_sc(), str)
 
 
-def _render_cosmetic_section(lines, cosmetic_eps):
+def _render_cosmetic_section(out, cosmetic_eps):
     """Render the collapsed cosmetic-changes section."""
-    lines.append("<details>")
-    lines.append(
+    w = out.write
+    w("<details>\n")
+    w(
         f"<summary>Cosmetic changes ({len(cosmetic_eps)} endpoints) - "
-        "tag/summary churn, no behavior impact</summary>\n"
+        "tag/summary churn, no behavior impact</summary>\n\n"
     )
-    for (method, path), diffs in cosmetic_eps:
-        lines.append(f"- `{method} {path}`")
-        for d in diffs:
-            lines.append(f"  - {d}")
-    lines.append("\n</details>")
+    for key, diffs in cosmetic_eps:
+        w(f"- `{key}`\n")
+        w("".join(f"  - {d}\n" for d in diffs))
+    w("\n</details>\n")
+
 
+def format_report(diff, out):
+    """Write a Markdown report grouped by impact (breaking, additive, cosmetic) to out.
 
-def format_report(diff):
-    """Format a Markdown report grouped by impact (breaking, additive, cosmetic)."""
-    lines = ["# Miro API Spec Diff Report\n"]
+    Returns the total number of reported changes.
+    """
+    w = out.write
+    w("# Miro API Spec Diff Report\n\n")
 
     breaking_eps = diff.breaking_eps()
     breaking_sc = diff.breaking_sc()
@@ -437,44 +540,52 @@ def format_report(diff):
     total = breaking_count + additive_count + cosmetic_count
 
     if total == 0:
-        lines.append("No changes detected.\n")
-        return "\n".join(lines)
+        w("No changes detected.\n\n")
+        return 0
 
-    lines.append(
+    w(
         f"**Summary:** {breaking_count} breaking, {additive_count} additive, "
-        f"{cosmetic_count} cosmetic.\n"
+        f"{cosmetic_count} cosmetic.\n\n"
     )
 
     if breaking_count:
-        _render_breaking_section(lines, diff)
+        _render_breaking_section(out, diff)
     if additive_count:
-        _render_additive_section(lines, diff)
+        _render_additive_section(out, diff)
     if cosmetic_eps:
-        _render_cosmetic_section(lines, cosmetic_eps)
+        _render_cosmetic_section(out, cosmetic_eps)
 
-    return "\n".join(lines)
+    return total
 
 
 def _diff_collection(baseline, current, diff_pair):
-    """Diff two name->dict collections; return (added, removed, changes)."""
-    base_keys = set(baseline)
-    cur_keys = set(current)
-    added = sorted(cur_keys - base_keys)
-    removed = sorted(base_keys - cur_keys)
+    """Diff two keyed collections; return (added, removed, changes)."""
+    if baseline is current:
+        return set(), set(), {}
+    base_keys = baseline.keys()
+    cur_keys = current.keys()
+    # Left unsorted; the report sorts them only when it renders them.
+    added = cur_keys - base_keys
+    removed = base_keys - cur_keys
+    # Probe the larger collection while walking the smaller one.
+    small, large = (baseline, current) if len(baseline) <= len(current) else (current, baseline)
     changes = {}
-    for key in sorted(base_keys & cur_keys):
-        result = diff_pair(baseline[key], current[key])
+    for key in sorted(k for k in small if k in large):
+        old, new = baseline[key], current[key]
+        # Most entries are unchanged between revisions; one equality check
+        # on the whole record skips the field-by-field pair diff for them.
+        if old == new:
+            continue
+        result = diff_pair(old, new)
         if any(result):
             changes[key] = result
     return added, removed, changes
 
 
-def compute_diff(baseline_spec, current_spec):
-    """Compute the full DiffResult between two parsed specs."""
-    baseline_endpoints = extract_endpoints(baseline_spec)
-    current_endpoints = extract_endpoints(current_spec)
-    baseline_schemas = extract_schemas(baseline_spec)
-    current_schemas = extract_schemas(current_spec)
+def compute_diff(baseline, current):
+    """Compute the full DiffResult between two (endpoints, schemas) pairs."""
+    baseline_endpoints, baseline_schemas = baseline
+    current_endpoints, current_schemas = current
 
     ep_added, ep_removed, ep_changes = _diff_collection(
         baseline_endpoints, current_endpoints, diff_endpoint_pair
@@ -495,16 +606,174 @@ def compute_diff(baseline_spec, current_spec):
     )
 
 
-def diff_total(diff):
-    """Return the total number of detected differences."""
-    return (
-        len(diff.ep_added)
-        + len(diff.ep_removed)
-        + len(diff.ep_changes)
-        + len(diff.sc_added)
-        + len(diff.sc_removed)
-        + len(diff.sc_changes)
-    )
+def load_spec(path: str) -> dict[str, Any]:
+    """Read and decode one OpenAPI JSON spec file."""
+    with open(path, "rb") as f:
+        return _json.loads(f.read())
+
+
+def _stream_sections(f):
+    """Yield (section, key, value) for each entry of the streamed sections.
+
+    Makes a single ijson pass over the file and builds only one path item or
+    schema object at a time.
+    """
+    section = key = builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            # Track nesting ourselves; ObjectBuilder's internals differ
+            # between ijson releases.
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield section, key, builder.value
+                builder = None
+        elif event == "map_key" and prefix in _STREAMED_SECTIONS:
+            section, key, builder = prefix, value, ijson.ObjectBuilder()
+
+
+def extract_spec(path: str) -> tuple[Endpoints, Schemas]:
+    """Return (endpoints, schemas) extracted from one spec file.
+
+    Decodes the whole file via load_spec() unless streaming is enabled (no
+    orjson, ijson with a C backend, and a spec of at least _STREAM_MIN_BYTES),
+    in which case `paths` and `components.schemas` are extracted in one
+    streaming pass.
+    """
+    if ijson is None or os.path.getsize(path) < _STREAM_MIN_BYTES:
+        spec = load_spec(path)
+        return (
+            extract_endpoints(spec.get("paths", {}).items()),
+            extract_schemas(spec.get("components", {}).get("schemas", {}).items()),
+        )
+
+    endpoints: Endpoints = {}
+    schemas: Schemas = {}
+    with open(path, "rb") as f:
+        for section, key, value in _stream_sections(f):
+            if section == "paths":
+                _add_path_endpoints(endpoints, key, value)
+            else:
+                _add_schema(schemas, key, value)
+    return endpoints, schemas
+
+
+def _file_digest(path: str) -> str:
+    """Return the blake2b hex digest of a file's bytes."""
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _enum_out(e: frozenset | None) -> list | None:
+    return None if e is None else list(e)
+
+
+def _enum_in(e: list | None) -> frozenset | None:
+    return None if e is None else frozenset(e)
+
+
+def _encode_extracted(endpoints: Endpoints, schemas: Schemas) -> dict[str, Any]:
+    """Flatten extracted records into JSON-serializable lists and dicts."""
+    e = {
+        key: [
+            ep.operation_id,
+            ep.summary,
+            ep.tags,
+            ep.deprecated,
+            {
+                name: [p.name, p.location, p.required, p.type, _enum_out(p.enum)]
+                for name, p in ep.parameters.items()
+            },
+            ep.request_body,
+            ep.responses,
+            ep.category,
+        ]
+        for key, ep in endpoints.items()
+    }
+    s = {
+        name: {
+            "properties": {
+                pname: [prop.type, _enum_out(prop.enum)]
+                for pname, prop in sc["properties"].items()
+            },
+            "required": list(sc["required"]),
+            "top_enum": _enum_out(sc["top_enum"]),
+        }
+        for name, sc in schemas.items()
+    }
+    return {"e": e, "s": s}
+
+
+def _decode_extracted(data: dict[str, Any]) -> tuple[Endpoints, Schemas]:
+    """Rebuild extracted records from the output of _encode_extracted()."""
+    endpoints: Endpoints = {}
+    for key, (op_id, summary, tags, deprecated, params, body, resps, cat) in data["e"].items():
+        endpoints[key] = Endpoint(
+            operation_id=op_id,
+            summary=summary,
+            tags=tags,
+            deprecated=deprecated,
+            parameters={
+                name: Param(pname, loc, req, typ, _enum_in(enum))
+                for name, (pname, loc, req, typ, enum) in params.items()
+            },
+            request_body=body,
+            responses=resps,
+            category=cat,
+        )
+    schemas: Schemas = {
+        name: {
+            "properties": {
+                pname: _intern_property(Property(typ, _enum_in(enum)))
+                for pname, (typ, enum) in sc["properties"].items()
+            },
+            "required": frozenset(sc["required"]),
+            "top_enum": _enum_in(sc["top_enum"]),
+        }
+        for name, sc in data["s"].items()
+    }
+    return endpoints, schemas
+
+
+def extract_spec_cached(path: str) -> tuple[Endpoints, Schemas]:
+    """Return extract_spec(path), reusing a JSON sidecar when it is fresh.
+
+    The sidecar lives at `<path>.v<CACHE_VERSION>.cache.json` and is keyed by
+    the spec's content digest, so repeat runs over an unchanged file skip the
+    full spec decode and the extraction. It is plain JSON rather than pickle
+    so it can be inspected and can never execute code on load. Cache I/O or
+    format failures fall back to a normal extraction.
+    """
+    cache_path = f"{path}.v{CACHE_VERSION}.cache.json"
+    digest = _file_digest(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = _json.loads(f.read())
+        if cached["digest"] == digest:
+            return _decode_extracted(cached)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
+    endpoints, schemas = extract_spec(path)
+    # Write then rename so a concurrent reader never sees a partial sidecar.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps({"digest": digest, **_encode_extracted(endpoints, schemas)}))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return endpoints, schemas
 
 
 def main():
@@ -512,14 +781,15 @@ def main():
         print(f"Usage: {sys.argv[0]} <baseline.json> <current.json>", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        baseline_spec = json.load(f)
-    with open(sys.argv[2]) as f:
-        current_spec = json.load(f)
+    extract = extract_spec_cached if os.environ.get("DIFF_SPEC_CACHE") == "1" else extract_spec
+    baseline = extract(sys.argv[1])
+    # Reuse one extraction when both arguments name the same file, so
+    # compute_diff() can short-circuit on identity.
+    current = baseline if os.path.samefile(sys.argv[1], sys.argv[2]) else extract(sys.argv[2])
 
-    diff = compute_diff(baseline_spec, current_spec)
-    print(format_report(diff))
-    sys.exit(1 if diff_total(diff) > 0 else 0)
+    diff = compute_diff(baseline, current)
+    total = format_report(diff, sys.stdout)
+    sys.exit(1 if total > 0 else 0)
 
 
 if __name__ == "__main__":
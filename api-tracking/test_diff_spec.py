@@ -0,0 +1,278 @@
+"""Tests for diff-spec.py's extraction, cache codec, and report.
+
+Run with: python3 -m unittest discover api-tracking
+"""
+
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SCRIPT = os.path.join(_HERE, "diff-spec.py")
+_spec = importlib.util.spec_from_file_location("diff_spec", _SCRIPT)
+diff_spec = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(diff_spec)
+
+SPEC = {
+    "paths": {
+        "/v2/boards/{board_id}": {
+            "parameters": [{"name": "ignored-path-level"}],
+            "get": {
+                "operationId": "get-board",
+                "summary": "Get board",
+                "tags": ["Boards"],
+                "parameters": [
+                    {
+                        "name": "board_id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"},
+                    },
+                    {
+                        "name": "sort",
+                        "in": "query",
+                        "schema": {"type": "string", "enum": ["asc", "desc"]},
+                    },
+                ],
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {"schema": {"$ref": "#/components/schemas/Board"}}
+                        }
+                    }
+                },
+            },
+            "delete": {"summary": "Delete board", "deprecated": True},
+        },
+        "/v2/orgs/{org_id}": {
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/Org"}}
+                    }
+                }
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Board": {
+                "properties": {
+                    "id": {"type": "string"},
+                    "kind": {"type": "string", "enum": ["board", "template"]},
+                    "size": {"type": "number", "nullable": True},
+                },
+                "required": ["id"],
+            },
+            "Org": {"enum": ["a", "b"]},
+        }
+    },
+}
+
+# Baseline/current pair covering a removed endpoint, an added enterprise
+# endpoint, a param type change, a schema enum removal, and a summary-only change.
+REPORT_BASELINE = {
+    "paths": {
+        "/v2/boards": {
+            "get": {
+                "summary": "List boards",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "integer"}}],
+            }
+        },
+        "/v2/boards/{board_id}": {"delete": {"summary": "Delete board"}},
+        "/v2/items": {"get": {"summary": "Get items"}},
+    },
+    "components": {
+        "schemas": {
+            "Board": {"properties": {"kind": {"type": "string", "enum": ["board", "template"]}}}
+        }
+    },
+}
+
+REPORT_CURRENT = {
+    "paths": {
+        "/v2/boards": {
+            "get": {
+                "summary": "List boards",
+                "parameters": [{"name": "limit", "in": "query", "schema": {"type": "string"}}],
+            }
+        },
+        "/v2/items": {"get": {"summary": "Get all items"}},
+        "/v2/orgs/{org_id}/teams": {"post": {"summary": "Create team"}},
+    },
+    "components": {
+        "schemas": {"Board": {"properties": {"kind": {"type": "string", "enum": ["board"]}}}}
+    },
+}
+
+EXPECTED_REPORT = """\
+# Miro API Spec Diff Report
+
+**Summary:** 3 breaking, 1 additive, 1 cosmetic.
+
+## :rotating_light: Breaking changes
+
+_Investigate these before the next release; they may affect existing tools._
+
+### Removed endpoints (1)
+
+### Standard
+
+| Method | Path | Summary |
+|--------|------|---------|
+| DELETE | `/v2/boards/{board_id}` | Delete board |
+
+### Endpoints with breaking changes (1)
+
+#### `GET /v2/boards`
+
+- param `limit` type: integer -> string
+
+### Schemas with breaking changes (1)
+
+#### `Board`
+
+- property `kind` removed enum values: ['template']
+
+## :sparkles: Additive changes
+
+_New surface; safe for existing callers but may unlock new tools._
+
+### New endpoints (1)
+
+### Enterprise
+
+| Method | Path | Summary |
+|--------|------|---------|
+| POST | `/v2/orgs/{org_id}/teams` | Create team |
+
+<details>
+<summary>Cosmetic changes (1 endpoints) - tag/summary churn, no behavior impact</summary>
+
+- `GET /v2/items`
+  - summary: 'Get items' -> 'Get all items'
+
+</details>
+"""
+
+
+def _write_spec(directory, name, spec):
+    """Write spec as JSON into directory and return its path."""
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        json.dump(spec, f)
+    return path
+
+
+class CacheCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.endpoints = diff_spec.extract_endpoints(SPEC["paths"].items())
+        self.schemas = diff_spec.extract_schemas(SPEC["components"]["schemas"].items())
+
+    def test_round_trip(self):
+        encoded = diff_spec._encode_extracted(self.endpoints, self.schemas)
+        # Go through real JSON text, as the sidecar does.
+        decoded = diff_spec._decode_extracted(json.loads(json.dumps(encoded)))
+        self.assertEqual(decoded, (self.endpoints, self.schemas))
+
+        endpoints, schemas = decoded
+        get = endpoints["GET /v2/boards/{board_id}"]
+        self.assertEqual(get.parameters["sort"].enum, frozenset({"asc", "desc"}))
+        self.assertIsNone(get.parameters["board_id"].enum)
+        self.assertIsNone(endpoints["DELETE /v2/boards/{board_id}"].request_body)
+        self.assertEqual(endpoints["POST /v2/orgs/{org_id}"].category, "enterprise")
+        self.assertIsNone(schemas["Board"]["top_enum"])
+        self.assertEqual(schemas["Org"]["top_enum"], frozenset({"a", "b"}))
+        self.assertEqual(schemas["Board"]["required"], frozenset({"id"}))
+
+    def test_malformed_sidecar_falls_back_to_extraction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_spec(tmp, "spec.json", SPEC)
+            cache_path = f"{path}.v{diff_spec.CACHE_VERSION}.cache.json"
+            with open(cache_path, "w") as f:
+                json.dump({"digest": diff_spec._file_digest(path), "e": [], "s": {}}, f)
+
+            self.assertEqual(
+                diff_spec.extract_spec_cached(path), (self.endpoints, self.schemas)
+            )
+
+
+@unittest.skipIf(ijson is None, "ijson is not installed")
+class StreamingExtractTest(unittest.TestCase):
+    def setUp(self):
+        saved = (diff_spec.ijson, diff_spec._STREAM_MIN_BYTES)
+        self.addCleanup(self._restore, saved)
+        diff_spec.ijson = ijson
+        diff_spec._STREAM_MIN_BYTES = 0
+
+    def _restore(self, saved):
+        diff_spec.ijson, diff_spec._STREAM_MIN_BYTES = saved
+
+    def assertStreamsLikeFullDecode(self, spec):
+        expected = (
+            diff_spec.extract_endpoints(spec["paths"].items()),
+            diff_spec.extract_schemas(spec["components"]["schemas"].items()),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_spec(tmp, "spec.json", spec)
+            self.assertEqual(diff_spec.extract_spec(path), expected)
+
+    def test_matches_full_decode(self):
+        spec = dict(SPEC, paths={**SPEC["paths"], "/v2/empty": {}})
+        self.assertStreamsLikeFullDecode(spec)
+
+    def test_empty_schemas(self):
+        spec = dict(SPEC, components={"schemas": {}})
+        self.assertStreamsLikeFullDecode(spec)
+
+
+class ReportTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.baseline = _write_spec(tmp.name, "baseline.json", REPORT_BASELINE)
+        self.current = _write_spec(tmp.name, "current.json", REPORT_CURRENT)
+
+    def _report(self, baseline_path, current_path):
+        diff = diff_spec.compute_diff(
+            diff_spec.extract_spec(baseline_path), diff_spec.extract_spec(current_path)
+        )
+        out = io.StringIO()
+        total = diff_spec.format_report(diff, out)
+        return out.getvalue(), total
+
+    def test_report_text_and_total(self):
+        report, total = self._report(self.baseline, self.current)
+        self.assertEqual(report, EXPECTED_REPORT)
+        self.assertEqual(total, 5)
+
+    def test_no_changes(self):
+        report, total = self._report(self.baseline, self.baseline)
+        self.assertEqual(report, "# Miro API Spec Diff Report\n\nNo changes detected.\n\n")
+        self.assertEqual(total, 0)
+
+    def test_exit_status(self):
+        changed = subprocess.run(
+            [sys.executable, _SCRIPT, self.baseline, self.current],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual((changed.returncode, changed.stdout), (1, EXPECTED_REPORT))
+        unchanged = subprocess.run(
+            [sys.executable, _SCRIPT, self.baseline, self.baseline], capture_output=True
+        )
+        self.assertEqual(unchanged.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()